@@ -2,73 +2,115 @@
 Configuration Management for Kalshi Trading Bot
 Centralized settings, validation, and environment loading
 """
+import functools
 import os
+import re
+from dataclasses import dataclass
 from typing import Literal
 from dotenv import load_dotenv
 
 load_dotenv()
 
 
+@dataclass(frozen=True, slots=True)
 class Config:
-    """Centralized configuration with validation"""
-    
+    """Centralized configuration with validation
+
+    Frozen/slotted so hot loops pay a fixed-offset attribute load instead of
+    a class-dict lookup per access.
+    """
+
     # API Configuration
-    KALSHI_API_KEY: str = os.getenv('KALSHI_API_KEY', '')
-    KALSHI_PRIVATE_KEY_PATH: str = os.getenv('KALSHI_PRIVATE_KEY_PATH', '')
-    KALSHI_ENV: Literal['demo', 'prod'] = os.getenv('KALSHI_ENV', 'demo')
-    
+    KALSHI_API_KEY: str
+    KALSHI_PRIVATE_KEY_PATH: str
+    KALSHI_ENV: Literal['demo', 'prod']
+
     # API URLs (base domain; include full path in requests)
-    KALSHI_BASE_URL: str = (
-        'https://demo-api.kalshi.co' if KALSHI_ENV == 'demo'
-        else 'https://api.elections.kalshi.com'
-    )
-    
-    NEWS_API_KEY: str = os.getenv('NEWS_API_KEY', '')
-    NEWS_API_URL: str = 'https://newsapi.org/v2/everything'
-    
+    KALSHI_BASE_URL: str
+
+    NEWS_API_KEY: str
+    NEWS_API_URL: str
+
     # Risk Management
-    INITIAL_BALANCE: float = float(os.getenv('INITIAL_BALANCE', '10000.0'))
-    RISK_PER_TRADE_PCT: float = float(os.getenv('RISK_PER_TRADE_PCT', '0.01'))
-    MAX_DAILY_DRAWDOWN_PCT: float = float(os.getenv('MAX_DAILY_DRAWDOWN_PCT', '0.05'))
-    MAX_OPEN_POSITIONS: int = int(os.getenv('MAX_OPEN_POSITIONS', '5'))
-    
+    INITIAL_BALANCE: float
+    RISK_PER_TRADE_PCT: float
+    MAX_DAILY_DRAWDOWN_PCT: float
+    MAX_OPEN_POSITIONS: int
+
     # Trading Parameters
-    DEVIATION_THRESHOLD: float = float(os.getenv('DEVIATION_THRESHOLD', '0.05'))
-    STOP_LOSS_DEVIATION: float = float(os.getenv('STOP_LOSS_DEVIATION', '0.05'))
-    SCAN_INTERVAL_SECONDS: int = int(os.getenv('SCAN_INTERVAL_SECONDS', '30'))
-    
+    DEVIATION_THRESHOLD: float
+    STOP_LOSS_DEVIATION: float
+    SCAN_INTERVAL_SECONDS: int
+
     # External Sources
-    POLL_AGGREGATOR_URL: str = os.getenv('POLL_AGGREGATOR_URL', 'https://www.realclearpolitics.com')
-    ENABLE_NEWS_TRIGGERS: bool = os.getenv('ENABLE_NEWS_TRIGGERS', 'true').lower() == 'true'
-    
+    POLL_AGGREGATOR_URL: str
+    ENABLE_NEWS_TRIGGERS: bool
+
     # Logging
-    LOG_LEVEL: str = os.getenv('LOG_LEVEL', 'INFO')
-    LOG_FILE: str = os.getenv('LOG_FILE', 'kalshi_bot.log')
-    
-    @classmethod
-    def validate(cls) -> list[str]:
+    LOG_LEVEL: str
+    LOG_FILE: str
+
+    def validate(self) -> list[str]:
         """Validate critical configuration. Returns list of errors."""
         errors = []
-        
-        if not cls.KALSHI_API_KEY:
+
+        if not self.KALSHI_API_KEY:
             errors.append("KALSHI_API_KEY not set")
-        if not cls.KALSHI_PRIVATE_KEY_PATH:
+        if not self.KALSHI_PRIVATE_KEY_PATH:
             errors.append("KALSHI_PRIVATE_KEY_PATH not set")
-        if cls.KALSHI_ENV not in ['demo', 'prod']:
+        if self.KALSHI_ENV not in ['demo', 'prod']:
             errors.append("KALSHI_ENV must be 'demo' or 'prod'")
-        
+
         # Risk validation
-        if cls.RISK_PER_TRADE_PCT <= 0 or cls.RISK_PER_TRADE_PCT > 0.1:
+        if self.RISK_PER_TRADE_PCT <= 0 or self.RISK_PER_TRADE_PCT > 0.1:
             errors.append("RISK_PER_TRADE_PCT should be 0-10%")
-        if cls.MAX_DAILY_DRAWDOWN_PCT <= 0 or cls.MAX_DAILY_DRAWDOWN_PCT > 0.5:
+        if self.MAX_DAILY_DRAWDOWN_PCT <= 0 or self.MAX_DAILY_DRAWDOWN_PCT > 0.5:
             errors.append("MAX_DAILY_DRAWDOWN_PCT should be 0-50%")
-        
+
         return errors
-    
-    @classmethod
-    def is_sandbox(cls) -> bool:
+
+    def is_sandbox(self) -> bool:
         """Check if running in sandbox/demo mode"""
-        return cls.KALSHI_ENV == 'demo'
+        return self.KALSHI_ENV == 'demo'
+
+
+@functools.lru_cache(maxsize=1)
+def get_config() -> tuple[Config, tuple[str, ...]]:
+    """Load and validate configuration exactly once
+
+    One pass over the environment (os.environ.get, skipping the getenv
+    wrapper frame) with validation fused in, so the bot, tests, and debug
+    scripts all share a single frozen instance plus its memoized errors.
+    """
+    _get = os.environ.get
+    env = _get('KALSHI_ENV', 'demo')
+    cfg = Config(
+        KALSHI_API_KEY=_get('KALSHI_API_KEY', ''),
+        KALSHI_PRIVATE_KEY_PATH=_get('KALSHI_PRIVATE_KEY_PATH', ''),
+        KALSHI_ENV=env,
+        KALSHI_BASE_URL=(
+            'https://demo-api.kalshi.co' if env == 'demo'
+            else 'https://api.elections.kalshi.com'
+        ),
+        NEWS_API_KEY=_get('NEWS_API_KEY', ''),
+        NEWS_API_URL='https://newsapi.org/v2/everything',
+        INITIAL_BALANCE=float(_get('INITIAL_BALANCE', '10000.0')),
+        RISK_PER_TRADE_PCT=float(_get('RISK_PER_TRADE_PCT', '0.01')),
+        MAX_DAILY_DRAWDOWN_PCT=float(_get('MAX_DAILY_DRAWDOWN_PCT', '0.05')),
+        MAX_OPEN_POSITIONS=int(_get('MAX_OPEN_POSITIONS', '5')),
+        DEVIATION_THRESHOLD=float(_get('DEVIATION_THRESHOLD', '0.05')),
+        STOP_LOSS_DEVIATION=float(_get('STOP_LOSS_DEVIATION', '0.05')),
+        SCAN_INTERVAL_SECONDS=int(_get('SCAN_INTERVAL_SECONDS', '30')),
+        POLL_AGGREGATOR_URL=_get('POLL_AGGREGATOR_URL', 'https://www.realclearpolitics.com'),
+        ENABLE_NEWS_TRIGGERS=_get('ENABLE_NEWS_TRIGGERS', 'true').lower() == 'true',
+        LOG_LEVEL=_get('LOG_LEVEL', 'INFO'),
+        LOG_FILE=_get('LOG_FILE', 'kalshi_bot.log'),
+    )
+    return cfg, tuple(cfg.validate())
+
+
+# Shared singletons - import these instead of re-reading the environment
+CONFIG, CONFIG_ERRORS = get_config()
 
 
 # Category mappings for fair value routing
@@ -79,11 +121,25 @@ CATEGORY_MAPPINGS = {
     'Climate': ['temperature', 'weather', 'climate'],
 }
 
+# Single combined pattern with one named group per category; one scan of the
+# title replaces up to ~20 substring checks per market
+_CATEGORY_RE = re.compile(
+    '|'.join(
+        f"(?P<{category}>{'|'.join(map(re.escape, keywords))})"
+        for category, keywords in CATEGORY_MAPPINGS.items()
+    ),
+    re.IGNORECASE,
+)
+
+
+@functools.lru_cache(maxsize=2048)
+def get_category(market_title: str, title_lower: str = None) -> str:
+    """Infer market category from title
 
-def get_category(market_title: str) -> str:
-    """Infer market category from title"""
-    title_lower = market_title.lower()
-    for category, keywords in CATEGORY_MAPPINGS.items():
-        if any(kw in title_lower for kw in keywords):
-            return category
+    Accepts an optional pre-normalized string so callers that already built
+    one (e.g. the fair value engine) avoid a second scan/allocation.
+    """
+    match = _CATEGORY_RE.search(title_lower if title_lower is not None else market_title)
+    if match:
+        return match.lastgroup
     return 'Other'
@@ -3,31 +3,83 @@ Fair Value Models - Edge Detection Engine
 Compute "true" probability vs Kalshi's implied odds to find mispricings
 Supports: Politics (poll aggregation), Economics (news-based), Arbitrage detection
 """
+from __future__ import annotations
+
+import functools
 import logging
-import aiohttp
 import asyncio
+import numpy as np
+import orjson
 from typing import Optional, Dict, List, Tuple
 from datetime import datetime
 import re
-from bs4 import BeautifulSoup
+from cachetools import TTLCache
 
-from config import Config, get_category
+from config import CONFIG, get_category
+from scoring import arb_candidate_pairs
 
 logger = logging.getLogger(__name__)
 
+# Keyword automatons compiled once at import: one linear scan over the text
+# matches every keyword simultaneously instead of looping patterns in Python
+_CANDIDATE_RE = re.compile(
+    r'(trump|biden|harris|desantis|haley|republican|democrat|gop)'
+    r'|(yes|no)\s+win',
+    re.IGNORECASE,
+)
+
+_INDICATOR_KEYWORDS = {
+    'cpi': ('cpi', 'inflation', 'consumer price'),
+    'jobs': ('jobs', 'unemployment', 'nonfarm', 'payroll'),
+    'gdp': ('gdp', 'growth', 'recession'),
+    'fed': ('fed', 'federal reserve', 'rate', 'fomc'),
+}
+_INDICATOR_RE = re.compile(
+    '|'.join(
+        f"(?P<{key}>{'|'.join(map(re.escape, keywords))})"
+        for key, keywords in _INDICATOR_KEYWORDS.items()
+    ),
+    re.IGNORECASE,
+)
+
+_SENTIMENT_SIGN = {
+    'beat': 1, 'exceed': 1, 'strong': 1, 'growth': 1, 'up': 1,
+    'miss': -1, 'weak': -1, 'decline': -1, 'down': -1, 'below': -1,
+}
+_SENTIMENT_RE = re.compile(
+    r'\b(' + '|'.join(map(re.escape, _SENTIMENT_SIGN)) + r')\b',
+    re.IGNORECASE,
+)
+
 
 class FairValueEngine:
     """Calculate fair value probabilities for different market types"""
-    
+
+    __slots__ = ('session', 'news_cache', 'poll_cache', '_news_inflight')
+
     def __init__(self):
         self.session: Optional[aiohttp.ClientSession] = None
-        self.news_cache: Dict[str, List[dict]] = {}
-        self.poll_cache: Dict[str, float] = {}
+        # Bounded + expiring: unbounded dicts leak memory over a long-running
+        # bot and never refresh stale fair values
+        self.news_cache: TTLCache = TTLCache(maxsize=256, ttl=600)
+        self.poll_cache: TTLCache = TTLCache(maxsize=1024, ttl=300)
+        # Single-flight map: concurrent scans awaiting the same news query
+        # share one HTTP request instead of racing the cache
+        self._news_inflight: Dict[str, asyncio.Future] = {}
     
     async def initialize(self):
         """Initialize async session"""
         if self.session is None or self.session.closed:
-            self.session = aiohttp.ClientSession()
+            # Keepalive + DNS cache so repeated news fetches reuse warm
+            # connections instead of redialing per query
+            import aiohttp
+
+            connector = aiohttp.TCPConnector(
+                limit_per_host=4,
+                ttl_dns_cache=300,
+                keepalive_timeout=60,
+            )
+            self.session = aiohttp.ClientSession(connector=connector)
     
     async def close(self):
         """Cleanup"""
@@ -42,10 +94,14 @@ class FairValueEngine:
         await self.initialize()
         
         title = market.get('title', '')
-        subtitle = market.get('subtitle', '')
-        full_text = f"{title} {subtitle}".lower()
-        
-        category = get_category(title)
+        # Normalize once per market and stash on the dict - monitoring
+        # re-touches the same market dicts every loop
+        full_text = market.get('_full_lower')
+        if full_text is None:
+            full_text = f"{title} {market.get('subtitle', '')}".lower()
+            market['_full_lower'] = full_text
+
+        category = get_category(title, full_text)
         
         try:
             if category == 'Politics':
@@ -58,15 +114,40 @@ class FairValueEngine:
                 # Fallback: Use market's own pricing as baseline
                 return self._extract_market_probability(market)
         except Exception as e:
-            logger.error(f"Fair value calc failed for {title}: {e}")
+            logger.error("Fair value calc failed for %s: %s", title, e)
             return self._extract_market_probability(market)
     
+    async def calculate_fair_values(self, markets: List[dict], concurrency: int = 16) -> List[float]:
+        """
+        Calculate fair values for a batch of markets concurrently
+        Bounded by a semaphore so a big scan can't stampede external APIs;
+        combined with the news single-flight, independent markets overlap
+        their network waits instead of paying sum-of-RTTs
+        """
+        sem = asyncio.Semaphore(concurrency)
+
+        async def one(market: dict) -> float:
+            async with sem:
+                return await self.calculate_fair_value(market)
+
+        return await asyncio.gather(*(one(m) for m in markets))
+
     def _extract_market_probability(self, market: dict) -> float:
         """Extract implied probability from Kalshi market prices"""
         yes_bid = market.get('yes_bid', 50)
         yes_ask = market.get('yes_ask', 50)
         # Mid-price as probability
         return (yes_bid + yes_ask) / 200.0
+
+    @staticmethod
+    def _extract_probabilities_vec(markets: List[dict]) -> np.ndarray:
+        """Implied mid-price probabilities for a whole batch in one vector op"""
+        arr = np.fromiter(
+            ((m.get('yes_bid', 50), m.get('yes_ask', 50)) for m in markets),
+            dtype=[('b', 'f4'), ('a', 'f4')],
+            count=len(markets),
+        )
+        return (arr['b'] + arr['a']) / np.float32(200.0)
     
     async def _calculate_politics_fair_value(self, query: str, market: dict) -> float:
         """
@@ -76,7 +157,7 @@ class FairValueEngine:
         # Extract candidate/proposition from query
         candidate = self._extract_candidate_name(query)
         if not candidate:
-            logger.warning(f"No candidate found in: {query}")
+            logger.warning("No candidate found in: %s", query)
             return self._extract_market_probability(market)
         
         # Check cache
@@ -88,28 +169,27 @@ class FairValueEngine:
         polls = await self._scrape_polls(candidate)
         
         if not polls:
-            logger.info(f"No polls found for {candidate}, using market price")
+            logger.info("No polls found for %s, using market price", candidate)
             return self._extract_market_probability(market)
         
         # Average recent polls (simple model - could weight by recency/quality)
         fair_value = sum(polls) / len(polls)
         self.poll_cache[cache_key] = fair_value
         
-        logger.debug(f"Politics fair value for {candidate}: {fair_value:.3f} (from {len(polls)} polls)")
+        logger.debug("Politics fair value for %s: %.3f (from %d polls)", candidate, fair_value, len(polls))
         return fair_value
     
-    def _extract_candidate_name(self, text: str) -> Optional[str]:
-        """Extract candidate/party name from market text"""
-        # Simple regex - expand for production
-        patterns = [
-            r'(trump|biden|harris|desantis|haley)',
-            r'(republican|democrat|gop)',
-            r'(yes|no)\s+win',
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return match.group(1).lower()
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _extract_candidate_name(text: str) -> Optional[str]:
+        """Extract candidate/party name from market text
+
+        Pure function of the text, so results are memoized - the same titles
+        recur scan after scan. Static so the instance isn't part of the key.
+        """
+        match = _CANDIDATE_RE.search(text)
+        if match:
+            return (match.group(1) or match.group(2)).lower()
         return None
     
     async def _scrape_polls(self, candidate: str) -> List[float]:
@@ -118,12 +198,15 @@ class FairValueEngine:
         In production: Use RCP API, 538 data, or Selenium for dynamic content
         """
         # STUB: Return simulated polls for demo
-        # TODO: Implement real scraping with BeautifulSoup/Selenium
+        # TODO: Implement real scraping with selectolax (lexbor C bindings,
+        # ~10-25x faster than BeautifulSoup) or Selenium for dynamic content:
+        #   from selectolax.parser import HTMLParser
+        #   rows = HTMLParser(html).css('table.polls tr')
         # Example targets:
         # - https://www.realclearpolitics.com/epolls/latest_polls/
         # - https://projects.fivethirtyeight.com/polls/
         
-        logger.debug(f"[STUB] Scraping polls for {candidate}")
+        logger.debug("[STUB] Scraping polls for %s", candidate)
         
         # Simulate polls (replace with real scraping)
         if 'trump' in candidate.lower():
@@ -152,50 +235,74 @@ class FairValueEngine:
         # Parse consensus (STUB - would use NLP/regex to extract forecasts)
         consensus_prob = self._parse_economic_consensus(news_articles, query)
         
-        logger.debug(f"Economics fair value for {indicator}: {consensus_prob:.3f}")
+        logger.debug("Economics fair value for %s: %.3f", indicator, consensus_prob)
         return consensus_prob
     
-    def _extract_economic_indicator(self, text: str) -> Optional[str]:
-        """Identify economic indicator from market text"""
-        indicators = {
-            'cpi': ['cpi', 'inflation', 'consumer price'],
-            'jobs': ['jobs', 'unemployment', 'nonfarm', 'payroll'],
-            'gdp': ['gdp', 'growth', 'recession'],
-            'fed': ['fed', 'federal reserve', 'rate', 'fomc'],
-        }
-        for key, keywords in indicators.items():
-            if any(kw in text for kw in keywords):
-                return key
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _extract_economic_indicator(text: str) -> Optional[str]:
+        """Identify economic indicator from market text (memoized)"""
+        match = _INDICATOR_RE.search(text)
+        if match:
+            return match.lastgroup
         return None
     
     async def _fetch_news(self, query: str, max_articles: int = 10) -> List[dict]:
-        """Fetch news from NewsAPI"""
-        if not Config.NEWS_API_KEY or not Config.ENABLE_NEWS_TRIGGERS:
+        """Fetch news from NewsAPI (cached + single-flight)"""
+        if not CONFIG.NEWS_API_KEY or not CONFIG.ENABLE_NEWS_TRIGGERS:
             return []
-        
+
         cache_key = f"news_{query}"
-        if cache_key in self.news_cache:
-            return self.news_cache[cache_key]
-        
+        cached = self.news_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Coalesce: if another coroutine is already fetching this query,
+        # wait on its result instead of issuing a duplicate request
+        inflight = self._news_inflight.get(cache_key)
+        if inflight is not None:
+            return await inflight
+
+        fut = asyncio.get_running_loop().create_future()
+        self._news_inflight[cache_key] = fut
+        try:
+            articles = await self._request_news(cache_key, query, max_articles)
+            fut.set_result(articles)
+        except Exception as e:
+            fut.set_exception(e)
+            raise
+        finally:
+            # CancelledError bypasses the except clause above; cancel the
+            # future so waiters already parked on it complete instead of
+            # hanging on a popped, never-resolved future
+            if not fut.done():
+                fut.cancel()
+            self._news_inflight.pop(cache_key, None)
+        return articles
+
+    async def _request_news(self, cache_key: str, query: str, max_articles: int) -> List[dict]:
+        """Issue the actual NewsAPI request and populate the cache"""
         try:
             params = {
                 'q': query,
-                'apiKey': Config.NEWS_API_KEY,
+                'apiKey': CONFIG.NEWS_API_KEY,
                 'pageSize': max_articles,
                 'language': 'en',
                 'sortBy': 'publishedAt',
             }
-            async with self.session.get(Config.NEWS_API_URL, params=params, timeout=10) as resp:
+            async with self.session.get(CONFIG.NEWS_API_URL, params=params, timeout=10) as resp:
                 if resp.status == 200:
-                    data = await resp.json()
+                    # orjson parses the raw bytes directly - much faster than
+                    # stdlib json on 50-200KB NewsAPI payloads
+                    data = orjson.loads(await resp.read())
                     articles = data.get('articles', [])
                     self.news_cache[cache_key] = articles
                     return articles
                 else:
-                    logger.warning(f"NewsAPI returned {resp.status}")
+                    logger.warning("NewsAPI returned %s", resp.status)
                     return []
         except Exception as e:
-            logger.error(f"News fetch failed: {e}")
+            logger.error("News fetch failed: %s", e)
             return []
     
     def _parse_economic_consensus(self, articles: List[dict], query: str) -> float:
@@ -203,17 +310,18 @@ class FairValueEngine:
         Parse consensus forecast from news articles (STUB)
         In production: Use NLP to extract numbers, analyst expectations, sentiment
         """
-        # STUB: Simple sentiment heuristic
-        positive_keywords = ['beat', 'exceed', 'strong', 'growth', 'up']
-        negative_keywords = ['miss', 'weak', 'decline', 'down', 'below']
-        
+        # STUB: Simple sentiment heuristic - one regex scan per article
+        # instead of a Python loop over every keyword
         positive_count = 0
         negative_count = 0
-        
+
         for article in articles[:5]:  # Top 5 articles
-            text = f"{article.get('title', '')} {article.get('description', '')}".lower()
-            positive_count += sum(1 for kw in positive_keywords if kw in text)
-            negative_count += sum(1 for kw in negative_keywords if kw in text)
+            text = f"{article.get('title', '')} {article.get('description', '')}"
+            for word in _SENTIMENT_RE.findall(text):
+                if _SENTIMENT_SIGN[word.lower()] > 0:
+                    positive_count += 1
+                else:
+                    negative_count += 1
         
         if positive_count + negative_count == 0:
             return 0.5  # Neutral
@@ -231,43 +339,50 @@ class FairValueEngine:
         Strategy: Scrape sports stats sites, compare to betting odds
         """
         # STUB: Would integrate ESPN API, sports reference, or betting markets
-        logger.debug(f"[STUB] Sports fair value for: {query}")
+        logger.debug("[STUB] Sports fair value for: %s", query)
         return self._extract_market_probability(market)
     
     async def detect_arbitrage(self, markets: List[dict]) -> List[Tuple[dict, dict, str]]:
         """
         Detect cross-market arbitrage opportunities
         E.g., "Trump wins primary" prob > "Trump wins general" prob (logical inconsistency)
+
+        The O(N^2) pairwise price screen runs as one NumPy broadcast; only the
+        (typically sparse) surviving pairs hit the Python relatedness check.
         """
+        n = len(markets)
+        if n < 2:
+            return []
+
+        probs = self._extract_probabilities_vec(markets)
+
+        # Price discrepancy screen for all pairs at once (STUB logic: simple
+        # discrepancy - enhance with logical inference). The kernel keeps the
+        # original i < j pair ordering and runs as native code under numba.
+        pair_i, pair_j = arb_candidate_pairs(probs, CONFIG.DEVIATION_THRESHOLD)
+        if len(pair_i) == 0:
+            return []
+
+        # Tokenize each title once into an integer bitmask: token ids are
+        # assigned from a shared vocab, so shared-word counting per pair is
+        # a single AND + popcount instead of a set intersection
+        vocab: Dict[str, int] = {}
+        masks = []
+        for m in markets:
+            mask = 0
+            for token in m['title'].lower().split():
+                mask |= 1 << vocab.setdefault(token, len(vocab))
+            masks.append(mask)
+
         arb_opportunities = []
-        
-        for i, m1 in enumerate(markets):
-            for m2 in markets[i+1:]:
-                # Check for related markets
-                if self._are_markets_related(m1, m2):
-                    prob1 = self._extract_market_probability(m1)
-                    prob2 = self._extract_market_probability(m2)
-                    
-                    # Check for logical inconsistency
-                    if self._is_arbitrage(m1, m2, prob1, prob2):
-                        reason = f"Arb: {m1['title'][:30]}... ({prob1:.2f}) vs {m2['title'][:30]}... ({prob2:.2f})"
-                        arb_opportunities.append((m1, m2, reason))
-                        logger.info(f"🎯 Arbitrage detected: {reason}")
-        
+        for i, j in zip(pair_i.tolist(), pair_j.tolist()):
+            # Relatedness heuristic: at least 2 shared title words
+            if (masks[i] & masks[j]).bit_count() < 2:
+                continue
+            m1, m2 = markets[i], markets[j]
+            prob1, prob2 = float(probs[i]), float(probs[j])
+            reason = f"Arb: {m1['title'][:30]}... ({prob1:.2f}) vs {m2['title'][:30]}... ({prob2:.2f})"
+            arb_opportunities.append((m1, m2, reason))
+            logger.info("🎯 Arbitrage detected: %s", reason)
+
         return arb_opportunities
-    
-    def _are_markets_related(self, m1: dict, m2: dict) -> bool:
-        """Check if two markets are logically related"""
-        # Simple heuristic: Shared keywords
-        words1 = set(m1['title'].lower().split())
-        words2 = set(m2['title'].lower().split())
-        shared = words1 & words2
-        return len(shared) >= 2  # At least 2 common words
-    
-    def _is_arbitrage(self, m1: dict, m2: dict, prob1: float, prob2: float) -> bool:
-        """
-        Detect arbitrage based on logical constraints
-        Example: If m1 implies m2, then P(m1) <= P(m2)
-        """
-        # STUB: Simple price discrepancy (enhance with logical inference)
-        return abs(prob1 - prob2) > Config.DEVIATION_THRESHOLD and prob1 > prob2 + 0.1
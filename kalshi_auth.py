@@ -5,19 +5,56 @@ Uses RSA-PSS signing for request authentication
 """
 import time
 import base64
+import functools
 from cryptography.hazmat.primitives import serialization, hashes
 from cryptography.hazmat.primitives.asymmetric import padding, rsa
-from cryptography.hazmat.backends import default_backend
 from pathlib import Path
 from typing import Optional
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Built once - re-instantiating the padding/hash objects per request just
+# churns allocations around what is ultimately a single libcrypto call
+_PSS_PADDING = padding.PSS(
+    mgf=padding.MGF1(hashes.SHA256()),
+    salt_length=padding.PSS.DIGEST_LENGTH,
+)
+_SHA256 = hashes.SHA256()
+
+
+@functools.lru_cache(maxsize=8)
+def _load_key_cached(path: str, mtime: float):
+    """Load and parse a PEM private key, cached on (path, mtime)
+
+    PEM parsing plus the OpenSSL key import costs a few ms; tests and debug
+    scripts construct KalshiAuth repeatedly, so re-instantiation becomes a
+    dict lookup until the file actually changes.
+    """
+    with open(path, "rb") as key_file:
+        return serialization.load_pem_private_key(
+            key_file.read(),
+            password=None,  # Add password parameter if key is encrypted
+        )
+
+
+@functools.lru_cache(maxsize=256)
+def _sign_pss(private_key, message: bytes) -> str:
+    """Sign message with RSA-PSS and return base64 signature
+
+    Cached on the exact signing string: the millisecond timestamp is part of
+    the message, so bursts of requests to the same endpoint within the same
+    millisecond reuse one signature instead of re-running RSA.
+    """
+    signature = private_key.sign(message, _PSS_PADDING, _SHA256)
+    return base64.b64encode(signature).decode("utf-8")
+
 
 class KalshiAuth:
     """Handle Kalshi API authentication with private key signing"""
-    
+
+    __slots__ = ('api_key', 'private_key_path', 'private_key')
+
     def __init__(self, api_key: str, private_key_path: str):
         self.api_key = api_key
         self.private_key_path = Path(private_key_path)
@@ -29,38 +66,25 @@ class KalshiAuth:
         try:
             if not self.private_key_path.exists():
                 raise FileNotFoundError(f"Private key file not found: {self.private_key_path}")
-            
-            with open(self.private_key_path, "rb") as key_file:
-                self.private_key = serialization.load_pem_private_key(
-                    key_file.read(),
-                    password=None,  # Add password parameter if key is encrypted
-                    backend=default_backend()
-                )
-            
-            logger.info(f"✅ Private key loaded from {self.private_key_path}")
+
+            mtime = self.private_key_path.stat().st_mtime
+            self.private_key = _load_key_cached(str(self.private_key_path), mtime)
+
+            logger.info("✅ Private key loaded from %s", self.private_key_path)
         
         except FileNotFoundError as e:
-            logger.error(f"❌ Private key file not found: {e}")
+            logger.error("❌ Private key file not found: %s", e)
             raise
         except Exception as e:
-            logger.error(f"❌ Failed to load private key: {e}")
+            logger.error("❌ Failed to load private key: %s", e)
             raise
     
     def _sign_pss_text(self, text: str) -> str:
         """Sign text with RSA-PSS and return base64 signature"""
         if not self.private_key:
             raise ValueError("Private key not loaded")
-        
-        message = text.encode("utf-8")
-        signature = self.private_key.sign(
-            message,
-            padding.PSS(
-                mgf=padding.MGF1(hashes.SHA256()),
-                salt_length=padding.PSS.DIGEST_LENGTH,
-            ),
-            hashes.SHA256(),
-        )
-        return base64.b64encode(signature).decode("utf-8")
+
+        return _sign_pss(self.private_key, text.encode("utf-8"))
     
     def get_auth_headers(self, method: str, path: str) -> dict:
         """
@@ -70,9 +94,10 @@ class KalshiAuth:
         if not self.private_key:
             raise ValueError("Private key not loaded")
         
-        # Use milliseconds timestamp
-        timestamp_ms = str(int(time.time() * 1000))
-        path_without_query = path.split("?")[0]
+        # Milliseconds timestamp via integer nanoseconds - skips the float
+        # multiply/truncate of time.time() * 1000
+        timestamp_ms = str(time.time_ns() // 1_000_000)
+        path_without_query = path.partition("?")[0] if "?" in path else path
         message = f"{timestamp_ms}{method.upper()}{path_without_query}"
         signature = self._sign_pss_text(message)
         
@@ -93,6 +118,5 @@ def load_private_key_from_file(file_path: str):
         private_key = serialization.load_pem_private_key(
             key_file.read(),
             password=None,
-            backend=default_backend()
         )
     return private_key
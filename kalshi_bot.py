@@ -9,19 +9,31 @@ Core Loop:
 4. Monitor positions: Cut losers fast (5% edge flip), let winners run
 5. Halt if daily drawdown >5% - PRESERVE CAPITAL
 """
+from __future__ import annotations
+
 import asyncio
-import aiohttp
+import time
 import logging
-import colorlog
-from typing import Optional, List, Dict
+import numpy as np
+import orjson
+from typing import Optional, List, Dict, TYPE_CHECKING
+from dataclasses import dataclass
 from datetime import datetime
-import backoff
-from aiolimiter import AsyncLimiter
+from cachetools import TTLCache
 
-from config import Config
+from config import CONFIG, CONFIG_ERRORS
 from risk_manager import RiskManager
 from fair_value import FairValueEngine
-from kalshi_auth import KalshiAuth
+from scoring import score_markets
+
+if TYPE_CHECKING:
+    # Heavy imports deferred to first use so display-only entry points
+    # (dashboard test) start without aiohttp/cryptography load time
+    import aiohttp
+    from kalshi_auth import KalshiAuth
+
+# Module-level binding skips the attribute lookup per response parse
+_loads = orjson.loads
 
 # Setup colored logging with UTF-8 encoding for emoji support on Windows
 import sys
@@ -30,28 +42,73 @@ if sys.platform == 'win32':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
 
-handler = colorlog.StreamHandler()
-handler.setFormatter(colorlog.ColoredFormatter(
-    '%(log_color)s%(asctime)s - %(levelname)s - %(message)s',
-    datefmt='%H:%M:%S',
-    log_colors={
-        'DEBUG': 'cyan',
-        'INFO': 'green',
-        'WARNING': 'yellow',
-        'ERROR': 'red',
-        'CRITICAL': 'red,bg_white',
-    }
-))
+# Color only helps an interactive terminal; under redirection or a service
+# manager the ANSI escapes are wasted bytes on every record, so the plain
+# formatter (and no colorlog import at all) is used there
+if sys.stderr.isatty():
+    import colorlog
+    handler = colorlog.StreamHandler()
+    handler.setFormatter(colorlog.ColoredFormatter(
+        '%(log_color)s%(asctime)s - %(levelname)s - %(message)s',
+        datefmt='%H:%M:%S',
+        log_colors={
+            'DEBUG': 'cyan',
+            'INFO': 'green',
+            'WARNING': 'yellow',
+            'ERROR': 'red',
+            'CRITICAL': 'red,bg_white',
+        }
+    ))
+else:
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter(
+        '%(asctime)s - %(levelname)s - %(message)s', datefmt='%H:%M:%S'))
 logger = logging.getLogger(__name__)
 logger.addHandler(handler)
-logger.setLevel(getattr(logging, Config.LOG_LEVEL))
+logger.setLevel(getattr(logging, CONFIG.LOG_LEVEL))
+logger.propagate = False  # records stop here; no double-handling at root
 
 # File logging
-file_handler = logging.FileHandler(Config.LOG_FILE)
+file_handler = logging.FileHandler(CONFIG.LOG_FILE)
 file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
 logger.addHandler(file_handler)
 
 
+# Typed views over the three hot response shapes. Slotted frozen instances
+# turn the per-call dict.get hash lookups in callers into C-level attribute
+# loads and carry no instance __dict__.
+
+@dataclass(slots=True, frozen=True)
+class BalanceResponse:
+    balance_cents: Optional[int]
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'BalanceResponse':
+        # None, not 0: a malformed 200 without a balance key must not be
+        # mistaken for an actual zero balance by risk checks downstream
+        raw = data.get('balance')
+        return cls(balance_cents=int(raw) if raw is not None else None)
+
+
+@dataclass(slots=True, frozen=True)
+class MarketsPage:
+    markets: List[dict]
+    cursor: Optional[str]
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'MarketsPage':
+        return cls(markets=data.get('markets', []), cursor=data.get('cursor'))
+
+
+@dataclass(slots=True, frozen=True)
+class OrderResult:
+    order: Optional[dict]
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'OrderResult':
+        return cls(order=data.get('order'))
+
+
 class KalshiBot:
     """
     Main trading bot - Michael Beer's fast execution style
@@ -62,30 +119,63 @@ class KalshiBot:
     
     def __init__(self):
         self.session: Optional[aiohttp.ClientSession] = None
-        self.auth = KalshiAuth(Config.KALSHI_API_KEY, Config.KALSHI_PRIVATE_KEY_PATH)
+        self._auth: Optional[KalshiAuth] = None
         self.risk_manager = RiskManager(
-            initial_balance=Config.INITIAL_BALANCE,
-            risk_per_trade_pct=Config.RISK_PER_TRADE_PCT,
-            max_daily_dd_pct=Config.MAX_DAILY_DRAWDOWN_PCT,
-            stop_loss_deviation=Config.STOP_LOSS_DEVIATION,
-            max_positions=Config.MAX_OPEN_POSITIONS,
+            initial_balance=CONFIG.INITIAL_BALANCE,
+            risk_per_trade_pct=CONFIG.RISK_PER_TRADE_PCT,
+            max_daily_dd_pct=CONFIG.MAX_DAILY_DRAWDOWN_PCT,
+            stop_loss_deviation=CONFIG.STOP_LOSS_DEVIATION,
+            max_positions=CONFIG.MAX_OPEN_POSITIONS,
         )
         self.fair_value_engine = FairValueEngine()
         
-        # Rate limiting: Kalshi allows ~10 req/s
-        self.rate_limiter = AsyncLimiter(10, 1)  # 10 requests per second
+        # Rate limiting: Kalshi allows ~10 req/s. Monotonic-clock token
+        # bucket - the under-limit path is a few arithmetic ops with no
+        # event-loop reschedule, unlike a limiter context manager
+        self._rate = 10.0  # tokens per second
+        self._burst = 10.0
+        self._tokens = 10.0
+        self._last_refill = time.monotonic()
         
+        # Conditional-GET cache: etag_key -> (ETag, parsed payload). A 304
+        # revalidation skips the body transfer and the JSON parse entirely.
+        # Bounded + expiring because cursor tokens rotate as markets open
+        # and close - an unbounded dict would pin every stale page forever.
+        self._etag_cache: TTLCache = TTLCache(maxsize=32, ttl=600)
+
         self.running = False
         self.loop_count = 0
     
+    @property
+    def auth(self) -> KalshiAuth:
+        """Lazily construct the signer - loading the private key pulls in
+        cryptography, which display-only paths (dashboard test) never need"""
+        if self._auth is None:
+            from kalshi_auth import KalshiAuth
+            self._auth = KalshiAuth(CONFIG.KALSHI_API_KEY, CONFIG.KALSHI_PRIVATE_KEY_PATH)
+        return self._auth
+
     async def initialize(self):
         """Setup async session with auth"""
+        import aiohttp
+
+        # Explicit connector so concurrent scan/monitor bursts reuse warm
+        # TLS connections instead of redialing; connect/read caps keep one
+        # hung socket from stalling a whole gather
+        connector = aiohttp.TCPConnector(
+            limit=32,
+            limit_per_host=32,
+            ttl_dns_cache=300,
+            keepalive_timeout=75,
+            enable_cleanup_closed=True,
+        )
         self.session = aiohttp.ClientSession(
-            base_url=Config.KALSHI_BASE_URL,
-            timeout=aiohttp.ClientTimeout(total=30)
+            base_url=CONFIG.KALSHI_BASE_URL,
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=30, connect=5, sock_read=10)
         )
         await self.fair_value_engine.initialize()
-        logger.info(f"🤖 Kalshi Bot initialized in {'SANDBOX' if Config.is_sandbox() else 'LIVE'} mode")
+        logger.info(f"🤖 Kalshi Bot initialized in {'SANDBOX' if CONFIG.is_sandbox() else 'LIVE'} mode")
     
     async def close(self):
         """Cleanup resources"""
@@ -94,18 +184,46 @@ class KalshiBot:
         await self.fair_value_engine.close()
         logger.info("Bot shut down cleanly")
     
-    @backoff.on_exception(backoff.expo, aiohttp.ClientError, max_tries=3)
-    async def _api_request(self, method: str, endpoint: str, **kwargs) -> Optional[dict]:
+    async def _api_request(self, method: str, endpoint: str, schema=None,
+                           etag_key: Optional[str] = None, **kwargs):
         """
         Make rate-limited API request with retry logic
-        Exponential backoff on failures - Beer's reliability focus
+        Inline exponential backoff on transport errors - Beer's reliability
+        focus without the decorator wrapper frames on the happy path
+
+        When `schema` is given the decoded body is wrapped via its
+        from_dict; otherwise the raw dict is returned. `etag_key` opts the
+        call into conditional GETs: a 304 reply returns the cached payload
+        with no body transfer or parse.
         """
-        async with self.rate_limiter:
+        import aiohttp  # sys.modules hit after initialize() loaded it
+
+        cached = self._etag_cache.get(etag_key) if etag_key else None
+        for attempt in range(3):
+            await self._acquire_rate_token()
             try:
                 headers = self.auth.get_auth_headers(method, endpoint)
+                if cached:
+                    headers['If-None-Match'] = cached[0]
                 async with self.session.request(method, endpoint, headers=headers, **kwargs) as resp:
+                    if resp.status == 304 and cached:
+                        return cached[1]
                     if resp.status == 200:
-                        return await resp.json()
+                        # Accumulate chunks into one bytearray and hand orjson
+                        # a memoryview - skips the immutable bytes join that
+                        # read() does on multi-chunk markets responses. The
+                        # buffer is per-call: scan and monitor gathers run
+                        # requests concurrently, so a shared pool would race.
+                        buf = bytearray()
+                        async for chunk in resp.content.iter_chunked(65536):
+                            buf += chunk
+                        data = _loads(memoryview(buf))
+                        result = schema.from_dict(data) if schema else data
+                        if etag_key:
+                            etag = resp.headers.get('ETag')
+                            if etag:
+                                self._etag_cache[etag_key] = (etag, result)
+                        return result
                     elif resp.status == 401:
                         logger.error("❌ Authentication failed - check API keys")
                         return None
@@ -115,22 +233,69 @@ class KalshiBot:
             except asyncio.TimeoutError:
                 logger.error(f"Timeout on {endpoint}")
                 return None
+            except aiohttp.ClientError as e:
+                if attempt == 2:
+                    logger.error(f"Request failed after retries on {endpoint}: {e}")
+                    return None
+                await asyncio.sleep(2 ** attempt * 0.1)
+        return None
+
+    async def _acquire_rate_token(self):
+        """Take one token from the rate bucket, sleeping only when empty
+
+        Tokens may go negative under a concurrent burst; each caller sleeps
+        proportionally to its share of the debt, which keeps the long-run
+        rate at self._rate without any per-call task bookkeeping.
+        """
+        now = time.monotonic()
+        self._tokens = min(self._burst, self._tokens + (now - self._last_refill) * self._rate)
+        self._last_refill = now
+        self._tokens -= 1.0
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / self._rate)
     
     async def fetch_balance(self) -> float:
         """Get current account balance"""
-        data = await self._api_request('GET', '/trade-api/v2/portfolio/balance')
-        if data and 'balance' in data:
-            balance = float(data['balance']) / 100  # Kalshi uses cents
+        resp = await self._api_request('GET', '/trade-api/v2/portfolio/balance',
+                                       schema=BalanceResponse)
+        if resp is not None and resp.balance_cents is not None:
+            balance = resp.balance_cents / 100  # Kalshi uses cents
             self.risk_manager.update_balance(balance)
             return balance
+        # Malformed or failed reply - keep the last known balance
         return self.risk_manager.current_balance
     
-    async def list_markets(self, status: str = 'open', limit: int = 100) -> List[dict]:
-        """Fetch open markets - scan for opportunities"""
-        data = await self._api_request('GET', '/trade-api/v2/markets', params={'status': status, 'limit': limit})
-        if data and 'markets' in data:
-            return data['markets']
-        return []
+    async def iter_markets(self, status: str = 'open', page: int = 200):
+        """Page through all markets via cursor tokens, yielding one at a time
+
+        Async generator so callers can start processing page 1 before the
+        last page arrives; previously a single limit=100 request silently
+        dropped everything past the first page.
+        """
+        cursor = None
+        while True:
+            params = {'status': status, 'limit': page}
+            if cursor:
+                params['cursor'] = cursor
+            resp = await self._api_request('GET', '/trade-api/v2/markets',
+                                           schema=MarketsPage, params=params,
+                                           etag_key=f"markets:{status}:{cursor}:{page}")
+            if resp is None:
+                return
+            for market in resp.markets:
+                yield market
+            cursor = resp.cursor
+            if not cursor:
+                return
+
+    async def list_markets(self, status: str = 'open', max_markets: int = 1000) -> List[dict]:
+        """Fetch open markets across all pages - scan for opportunities"""
+        markets: List[dict] = []
+        async for market in self.iter_markets(status=status):
+            markets.append(market)
+            if len(markets) >= max_markets:
+                break
+        return markets
     
     async def get_market_details(self, market_id: str) -> Optional[dict]:
         """Get detailed market data"""
@@ -149,10 +314,12 @@ class KalshiBot:
             'type': order_type,  # 'market' for speed
         }
         
-        data = await self._api_request('POST', '/trade-api/v2/orders', json=payload)
-        
-        if data and data.get('order'):
-            logger.info(f"✅ ORDER FILLED: {market_id} {side} x{count}")
+        # Serialize with orjson; Content-Type is already set by the auth headers
+        resp = await self._api_request('POST', '/trade-api/v2/orders',
+                                       schema=OrderResult, data=orjson.dumps(payload))
+
+        if resp is not None and resp.order:
+            logger.info("✅ ORDER FILLED: %s %s x%d", market_id, side, count)
             return True
         else:
             logger.error(f"❌ ORDER FAILED: {market_id} {side} x{count}")
@@ -166,73 +333,99 @@ class KalshiBot:
         3. Trigger if mispricing >5%
         4. Execute with 1% sizing
         """
+        # Bind hot attributes/constants into locals once per scan -
+        # LOAD_FAST instead of repeated attribute resolution in the loop
+        risk_mgr = self.risk_manager
+        fv_engine = self.fair_value_engine
+        now = datetime.now()  # one timestamp shared by every add this scan
+
         markets = await self.list_markets()
         if not markets:
             logger.warning("No markets fetched")
             return
         
-        logger.debug(f"Scanning {len(markets)} markets...")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Scanning %d markets...", len(markets))
         
         # Detect arbitrage opportunities
-        arb_opps = await self.fair_value_engine.detect_arbitrage(markets)
+        arb_opps = await fv_engine.detect_arbitrage(markets)
         for m1, m2, reason in arb_opps:
-            logger.info(f"🎯 {reason}")
+            logger.info("🎯 %s", reason)
             # TODO: Execute arb trades (buy low, sell high simultaneously)
         
-        # Scan for mispricings
-        for market in markets:
-            if self.risk_manager.halted:
-                logger.warning("⏸️ Trading halted - skipping new positions")
-                break
-            
-            # Skip if already have position
-            if market.get('ticker') in self.risk_manager.positions:
-                continue
-            
+        if risk_mgr.halted:
+            logger.warning("⏸️ Trading halted - skipping new positions")
+            return
+
+        # Pass 1: fair values for all candidate markets concurrently -
+        # latency becomes ~max(RTT) instead of sum(RTT) across markets
+        held = risk_mgr.held_ids()
+        candidates = [
+            m for m in markets
+            if m.get('ticker') not in held
+        ]
+        if not candidates:
+            return
+        fair_probs = await fv_engine.calculate_fair_values(candidates, concurrency=8)
+
+        # Edge/side/entry/sizing math for the whole batch runs in one scoring
+        # kernel call (native code when numba is present) on SoA arrays
+        n = len(candidates)
+        bids = np.fromiter((m.get('yes_bid', 50) for m in candidates), dtype=np.float32, count=n)
+        asks = np.fromiter((m.get('yes_ask', 50) for m in candidates), dtype=np.float32, count=n)
+        fair = np.asarray(fair_probs, dtype=np.float32)
+        mask, devs, sides, entries, sizes = score_markets(
+            bids, asks, fair,
+            risk_mgr.current_balance,
+            CONFIG.RISK_PER_TRADE_PCT,
+            CONFIG.STOP_LOSS_DEVIATION,
+            CONFIG.DEVIATION_THRESHOLD,
+        )
+        implied = (bids + asks) * np.float32(0.005)  # cents -> mid probability
+
+        # Pass 2: only markets clearing the edge threshold reach the Python
+        # order path; risk checks and placement stay serial so risk-manager
+        # state mutates in a deterministic order
+        for i in np.nonzero(mask)[0].tolist():
+            market = candidates[i]
+
             # Check if can open new position
-            can_open, reason = self.risk_manager.can_open_position()
+            can_open, reason = risk_mgr.can_open_position()
             if not can_open:
-                logger.debug(f"Position limit: {reason}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Position limit: %s", reason)
                 break
-            
+
             try:
-                # Calculate fair value
-                fair_prob = await self.fair_value_engine.calculate_fair_value(market)
-                
-                # Extract market's implied probability
-                yes_bid = market.get('yes_bid', 50) / 100.0
-                yes_ask = market.get('yes_ask', 50) / 100.0
-                implied_prob = (yes_bid + yes_ask) / 2.0
-                
-                # Calculate deviation (edge)
-                deviation = abs(fair_prob - implied_prob)
-                
-                # Trigger trade if edge >5%
-                if deviation >= Config.DEVIATION_THRESHOLD:
-                    # Determine side: Buy underpriced, sell overpriced
-                    side = 'yes' if fair_prob > implied_prob else 'no'
-                    entry_price = yes_ask if side == 'yes' else (1 - yes_bid)
-                    
-                    # Calculate position size
-                    size = self.risk_manager.calculate_position_size(entry_price, deviation)
-                    
-                    if size >= 1:
+                fair_prob = float(fair[i])
+                implied_prob = float(implied[i])
+                deviation = float(devs[i])
+                side = 'yes' if sides[i] else 'no'
+                entry_price = float(entries[i])
+                size = float(sizes[i])
+
+                if size >= 1:
+                    # %-style defers the string build to the handler; the
+                    # slice/percent formatting only runs if INFO is live
+                    if logger.isEnabledFor(logging.INFO):
                         logger.info(
-                            f"🔍 EDGE FOUND: {market['title'][:50]}... | "
-                            f"Fair: {fair_prob:.2%} | Implied: {implied_prob:.2%} | "
-                            f"Edge: {deviation:.2%} | Side: {side.upper()}"
+                            "🔍 EDGE FOUND: %s... | Fair: %.2f%% | Implied: %.2f%% | "
+                            "Edge: %.2f%% | Side: %s",
+                            market['title'][:50], fair_prob * 100,
+                            implied_prob * 100, deviation * 100, side.upper(),
+                        )
+
+                    # Execute trade
+                    if await self.place_order(market.get('ticker'), side, int(size)):
+                        risk_mgr.add_position(
+                            market_id=market.get('ticker'),
+                            side=side,
+                            size=size,
+                            entry_price=entry_price,
+                            entry_fair_value=fair_prob,
+                            now=now,
                         )
-                        
-                        # Execute trade
-                        if await self.place_order(market.get('ticker'), side, int(size)):
-                            self.risk_manager.add_position(
-                                market_id=market.get('ticker'),
-                                side=side,
-                                size=size,
-                                entry_price=entry_price,
-                                entry_fair_value=fair_prob,
-                            )
-            
+
             except Exception as e:
                 logger.error(f"Error processing {market.get('title', 'unknown')}: {e}")
     
@@ -292,41 +485,60 @@ class KalshiBot:
         1. Edge deterioration (fair value shifted >5%)
         2. Execute exit if stop triggered
         """
-        if not self.risk_manager.positions:
+        if not self.risk_manager.held_ids():
             return
         
-        logger.debug(f"Monitoring {len(self.risk_manager.positions)} positions...")
-        
-        for market_id in list(self.risk_manager.positions.keys()):
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Monitoring %d positions...", len(self.risk_manager.held_ids()))
+
+        async def _monitor_one(mid: str):
+            # Fetch latest market data + recalculate fair value
+            market = await self.get_market_details(mid)
+            if not market:
+                return None
+            current_fair = await self.fair_value_engine.calculate_fair_value(market)
+            return mid, market, current_fair
+
+        # Fire all per-position refreshes concurrently - monitoring latency is
+        # max(RTT) instead of sum(RTT), so edge flips get caught sooner
+        results = await asyncio.gather(
+            *(_monitor_one(mid) for mid in list(self.risk_manager.held_ids())),
+            return_exceptions=True,
+        )
+
+        # Mutate risk-manager state sequentially to preserve ordering
+        refreshed: Dict[str, tuple] = {}
+        for result in results:
+            if isinstance(result, BaseException):
+                logger.error(f"Error monitoring position: {result}")
+                continue
+            if result is None:
+                continue
+
+            market_id, market, current_fair = result
+            yes_bid = market.get('yes_bid', 50) / 100.0
+            yes_ask = market.get('yes_ask', 50) / 100.0
+            current_price = (yes_bid + yes_ask) / 2.0
+            self.risk_manager.update_position(market_id, current_price, current_fair)
+            refreshed[market_id] = (market, current_price)
+
+        # One vectorized screen over the whole book, then only the hits
+        # reach the per-position exit path. Materialize the Position views
+        # once - the property rebuilds the whole book on every access
+        positions = self.risk_manager.positions
+        for market_id, cut_reason in self.risk_manager.find_cuts():
+            if market_id not in refreshed:
+                continue
+            market, current_price = refreshed[market_id]
             try:
-                # Fetch latest market data
-                market = await self.get_market_details(market_id)
-                if not market:
-                    continue
-                
-                # Recalculate fair value
-                current_fair = await self.fair_value_engine.calculate_fair_value(market)
-                
-                # Get current market price
-                yes_bid = market.get('yes_bid', 50) / 100.0
-                yes_ask = market.get('yes_ask', 50) / 100.0
-                current_price = (yes_bid + yes_ask) / 2.0
-                
-                # Update position
-                self.risk_manager.update_position(market_id, current_price, current_fair)
-                
-                # Check if should cut
-                should_cut, cut_reason = self.risk_manager.should_cut_position(market_id)
-                
-                if should_cut:
-                    position = self.risk_manager.positions[market_id]
-                    exit_side = 'no' if position.side == 'yes' else 'yes'  # Close opposite side
-                    
-                    logger.warning(f"🔪 CUTTING LOSER: {market['title'][:50]}... | {cut_reason}")
-                    
-                    if await self.place_order(market_id, exit_side, int(position.size)):
-                        self.risk_manager.close_position(market_id, current_price, cut_reason)
-                
+                position = positions[market_id]
+                exit_side = 'no' if position.side == 'yes' else 'yes'  # Close opposite side
+
+                logger.warning(f"🔪 CUTTING LOSER: {market['title'][:50]}... | {cut_reason}")
+
+                if await self.place_order(market_id, exit_side, int(position.size)):
+                    self.risk_manager.close_position(market_id, current_price, cut_reason)
+
             except Exception as e:
                 logger.error(f"Error monitoring position {market_id}: {e}")
     
@@ -337,14 +549,14 @@ class KalshiBot:
         """
         logger.info("=" * 60)
         logger.info("🚀 KALSHI BOT STARTING - Michael Beer Style")
-        logger.info(f"Environment: {'SANDBOX (Paper Trading)' if Config.is_sandbox() else '⚠️ LIVE TRADING'}")
-        logger.info(f"Initial Balance: ${Config.INITIAL_BALANCE:,.2f}")
-        logger.info(f"Risk per Trade: {Config.RISK_PER_TRADE_PCT:.1%}")
-        logger.info(f"Max Daily Drawdown: {Config.MAX_DAILY_DRAWDOWN_PCT:.1%}")
+        logger.info(f"Environment: {'SANDBOX (Paper Trading)' if CONFIG.is_sandbox() else '⚠️ LIVE TRADING'}")
+        logger.info(f"Initial Balance: ${CONFIG.INITIAL_BALANCE:,.2f}")
+        logger.info(f"Risk per Trade: {CONFIG.RISK_PER_TRADE_PCT:.1%}")
+        logger.info(f"Max Daily Drawdown: {CONFIG.MAX_DAILY_DRAWDOWN_PCT:.1%}")
         logger.info("=" * 60)
         
-        # Validate config
-        errors = Config.validate()
+        # Validate config (memoized at load time)
+        errors = CONFIG_ERRORS
         if errors:
             logger.critical(f"❌ Configuration errors: {errors}")
             return
@@ -355,7 +567,10 @@ class KalshiBot:
         await self.fetch_balance()
         
         self.running = True
-        
+
+        # Bound outside the loop - LOAD_FAST per iteration
+        scan_interval = CONFIG.SCAN_INTERVAL_SECONDS
+
         try:
             while self.running:
                 self.loop_count += 1
@@ -378,7 +593,7 @@ class KalshiBot:
                     self.print_portfolio_dashboard()
                 
                 # Sleep before next scan
-                await asyncio.sleep(Config.SCAN_INTERVAL_SECONDS)
+                await asyncio.sleep(scan_interval)
         
         except KeyboardInterrupt:
             logger.info("⏹️ Shutdown signal received")
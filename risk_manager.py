@@ -3,15 +3,30 @@ Risk Management System - Preserve Capital Edition
 Implements position sizing, stop losses, drawdown limits, and PTJ-style risk controls
 """
 import logging
-from typing import Dict, Optional
-from datetime import datetime, timedelta
+import time
+import numpy as np
+from typing import Dict, List, Optional
+from datetime import datetime
+
+from scoring import njit
 
 logger = logging.getLogger(__name__)
 
 
+@njit('float64(float64, float64, float64, float64, float64)', cache=True)
+def _calc_size(balance, price, dev, stop_dev, risk_pct):
+    """Scalar sizing kernel - pinned signature compiles eagerly at import
+    when numba is installed, so per-trade calls run as native code"""
+    if balance <= 0.0 or price <= 0.0:
+        return 0.0
+    mult = min(dev / stop_dev, 1.5)
+    size = round(balance * risk_pct * mult / price)
+    return max(1.0, size)
+
+
 class Position:
     """Track individual position state"""
-    def __init__(self, market_id: str, side: str, size: float, entry_price: float, 
+    def __init__(self, market_id: str, side: str, size: float, entry_price: float,
                  entry_fair_value: float, timestamp: datetime):
         self.market_id = market_id
         self.side = side  # 'yes' or 'no'
@@ -21,12 +36,12 @@ class Position:
         self.timestamp = timestamp
         self.current_price: Optional[float] = None
         self.current_fair_value: Optional[float] = None
-    
+
     def update(self, current_price: float, current_fair_value: float):
         """Update position with latest market data"""
         self.current_price = current_price
         self.current_fair_value = current_fair_value
-    
+
     def pnl(self) -> float:
         """Calculate unrealized P&L"""
         if self.current_price is None:
@@ -34,7 +49,7 @@ class Position:
         price_diff = self.current_price - self.entry_price
         multiplier = 1 if self.side == 'yes' else -1
         return multiplier * price_diff * self.size
-    
+
     def edge_deterioration(self) -> float:
         """Calculate how much edge has eroded (positive = edge lost)"""
         if self.current_fair_value is None:
@@ -49,8 +64,12 @@ class RiskManager:
     - Cut losers fast (5% edge flip)
     - Let winners run (no early exits)
     - 5% daily drawdown halt
+
+    Positions live in Structure-of-Arrays NumPy buffers so portfolio-wide
+    math (total P&L, cut detection) runs as vector expressions; the
+    `positions` property materializes Position objects for display paths.
     """
-    
+
     def __init__(self, initial_balance: float, risk_per_trade_pct: float = 0.01,
                  max_daily_dd_pct: float = 0.05, stop_loss_deviation: float = 0.05,
                  max_positions: int = 5):
@@ -61,154 +80,310 @@ class RiskManager:
         self.max_daily_dd_pct = max_daily_dd_pct
         self.stop_loss_deviation = stop_loss_deviation
         self.max_positions = max_positions
-        
-        self.positions: Dict[str, Position] = {}
+
+        # SoA position store; arrays stay packed (close swaps with last)
+        capacity = max(max_positions, 8)
+        self._ids: List[str] = []
+        self._id_to_idx: Dict[str, int] = {}
+        self._timestamps: List[datetime] = []
+        self._sides = np.zeros(capacity, dtype=np.int8)  # +1 yes / -1 no
+        self._sizes = np.zeros(capacity, dtype=np.float64)
+        self._entry_prices = np.zeros(capacity, dtype=np.float64)
+        self._entry_fv = np.zeros(capacity, dtype=np.float64)
+        self._cur_prices = np.full(capacity, np.nan)
+        self._cur_fv = np.full(capacity, np.nan)
+
         self.daily_start_balance = initial_balance
-        self.daily_reset_time = datetime.now().replace(hour=0, minute=0, second=0)
+        self._reset_day = int(time.time() // 86400)  # UTC epoch day
         self.halted = False
         self.halt_reason: Optional[str] = None
-    
+
+        # Portfolio summary cache - recomputed only after state mutates
+        self._summary_dirty = True
+        self._cached_summary: Optional[dict] = None
+
+    # --- SoA plumbing -----------------------------------------------------
+
+    @property
+    def positions(self) -> Dict[str, Position]:
+        """Materialize the SoA store as {market_id: Position}
+
+        Display/compatibility view - hot paths should use the arrays.
+        """
+        out: Dict[str, Position] = {}
+        for idx, market_id in enumerate(self._ids):
+            pos = Position(
+                market_id=market_id,
+                side='yes' if self._sides[idx] > 0 else 'no',
+                size=float(self._sizes[idx]),
+                entry_price=float(self._entry_prices[idx]),
+                entry_fair_value=float(self._entry_fv[idx]),
+                timestamp=self._timestamps[idx],
+            )
+            if not np.isnan(self._cur_prices[idx]):
+                pos.update(float(self._cur_prices[idx]), float(self._cur_fv[idx]))
+            out[market_id] = pos
+        return out
+
+    def held_ids(self):
+        """Open market ids as a keys view - O(1) membership, no Position
+        materialization (unlike the `positions` property)"""
+        return self._id_to_idx.keys()
+
+    @positions.setter
+    def positions(self, mapping: Dict[str, Position]):
+        """Ingest a mapping of Position objects (used by tests/tools)"""
+        self._ids.clear()
+        self._id_to_idx.clear()
+        self._timestamps.clear()
+        for market_id, pos in mapping.items():
+            idx = self._append(market_id, pos.side, pos.size, pos.entry_price,
+                               pos.entry_fair_value, pos.timestamp)
+            if pos.current_price is not None:
+                self._cur_prices[idx] = pos.current_price
+                self._cur_fv[idx] = pos.current_fair_value
+
+    def _append(self, market_id: str, side: str, size: float, entry_price: float,
+                entry_fair_value: float, timestamp: datetime) -> int:
+        idx = len(self._ids)
+        if idx >= len(self._sides):
+            self._grow()
+        self._ids.append(market_id)
+        self._id_to_idx[market_id] = idx
+        self._timestamps.append(timestamp)
+        self._sides[idx] = 1 if side == 'yes' else -1
+        self._sizes[idx] = size
+        self._entry_prices[idx] = entry_price
+        self._entry_fv[idx] = entry_fair_value
+        self._cur_prices[idx] = np.nan
+        self._cur_fv[idx] = np.nan
+        self._summary_dirty = True
+        return idx
+
+    def _grow(self):
+        """Double array capacity (amortized O(1) appends)"""
+        new_cap = len(self._sides) * 2
+        self._sides = np.resize(self._sides, new_cap)
+        self._sizes = np.resize(self._sizes, new_cap)
+        self._entry_prices = np.resize(self._entry_prices, new_cap)
+        self._entry_fv = np.resize(self._entry_fv, new_cap)
+        self._cur_prices = np.resize(self._cur_prices, new_cap)
+        self._cur_fv = np.resize(self._cur_fv, new_cap)
+
+    def _remove(self, market_id: str):
+        """Swap-with-last removal keeps the arrays packed"""
+        idx = self._id_to_idx.pop(market_id)
+        last = len(self._ids) - 1
+        if idx != last:
+            last_id = self._ids[last]
+            self._ids[idx] = last_id
+            self._id_to_idx[last_id] = idx
+            self._timestamps[idx] = self._timestamps[last]
+            for arr in (self._sides, self._sizes, self._entry_prices,
+                        self._entry_fv, self._cur_prices, self._cur_fv):
+                arr[idx] = arr[last]
+        self._ids.pop()
+        self._timestamps.pop()
+        self._summary_dirty = True
+
+    def _pnl_vector(self) -> np.ndarray:
+        """Unrealized P&L for all open positions in one vector expression"""
+        n = len(self._ids)
+        diff = self._cur_prices[:n] - self._entry_prices[:n]
+        pnl = np.where(np.isnan(diff), 0.0, diff) * self._sides[:n] * self._sizes[:n]
+        return pnl
+
+    # --- Balance / drawdown ----------------------------------------------
+
     def update_balance(self, new_balance: float):
         """Update current balance and track peak"""
         self.current_balance = new_balance
         self.peak_balance = max(self.peak_balance, new_balance)
+        self._summary_dirty = True
         self._check_daily_reset()
-    
+
     def _check_daily_reset(self):
-        """Reset daily tracking at midnight"""
-        now = datetime.now()
-        if now.date() > self.daily_reset_time.date():
+        """Reset daily tracking when the UTC epoch day rolls over
+
+        Integer day compare - one clock read and one floor divide, versus
+        building two datetime/date objects per check.
+        """
+        today = int(time.time() // 86400)
+        if today > self._reset_day:
             self.daily_start_balance = self.current_balance
-            self.daily_reset_time = now.replace(hour=0, minute=0, second=0)
+            self._reset_day = today
             if self.halt_reason == 'daily_drawdown':
                 logger.info("Daily reset - resuming trading")
                 self.halted = False
                 self.halt_reason = None
-    
+
     def check_daily_drawdown(self) -> bool:
         """Check if daily drawdown limit breached - PRESERVE CAPITAL"""
         daily_pnl = self.current_balance - self.daily_start_balance
         daily_dd_pct = daily_pnl / self.daily_start_balance
-        
+
         if daily_dd_pct <= -self.max_daily_dd_pct:
             if not self.halted:
                 self.halted = True
                 self.halt_reason = 'daily_drawdown'
+                self._summary_dirty = True
                 logger.error(f"🛑 DAILY DRAWDOWN HALT: {daily_dd_pct:.2%} - Preserving capital")
             return True
         return False
-    
-    def calculate_position_size(self, market_price: float, edge_deviation: float, 
+
+    def calculate_position_size(self, market_price: float, edge_deviation: float,
                                 balance_override: Optional[float] = None) -> float:
         """
         Calculate position size using risk-based approach
         Size = (Balance * RiskPct) / Price, scaled by edge strength
         """
         balance = balance_override or self.current_balance
-        if balance <= 0 or market_price <= 0:
-            return 0.0
-        
-        # Base risk allocation
-        risk_amount = balance * self.risk_per_trade_pct
-        
-        # Scale by edge strength (stronger edge = larger size, up to max)
-        edge_multiplier = min(edge_deviation / self.stop_loss_deviation, 1.5)
-        adjusted_risk = risk_amount * edge_multiplier
-        
-        # Convert to contract count
-        size = adjusted_risk / market_price
-        return max(1.0, round(size))  # Minimum 1 contract
-    
+        return float(_calc_size(balance, market_price, edge_deviation,
+                                self.stop_loss_deviation, self.risk_per_trade_pct))
+
     def can_open_position(self) -> tuple[bool, Optional[str]]:
         """Check if new position allowed"""
         if self.halted:
             return False, f"Trading halted: {self.halt_reason}"
-        
-        if len(self.positions) >= self.max_positions:
+
+        if len(self._ids) >= self.max_positions:
             return False, f"Max positions reached ({self.max_positions})"
-        
+
         if self.current_balance < self.initial_balance * 0.5:
             return False, "Balance below 50% of initial - risk limit"
-        
+
         return True, None
-    
+
     def add_position(self, market_id: str, side: str, size: float, entry_price: float,
-                     entry_fair_value: float) -> bool:
-        """Register new position"""
+                     entry_fair_value: float, now: Optional[datetime] = None) -> bool:
+        """Register new position
+
+        `now` lets callers in a scan loop capture one timestamp and reuse it
+        across positions instead of hitting the OS clock per call.
+        """
         can_open, reason = self.can_open_position()
         if not can_open:
             logger.warning(f"Position rejected: {reason}")
             return False
-        
-        position = Position(
-            market_id=market_id,
-            side=side,
-            size=size,
-            entry_price=entry_price,
-            entry_fair_value=entry_fair_value,
-            timestamp=datetime.now()
-        )
-        self.positions[market_id] = position
+
+        self._append(market_id, side, size, entry_price, entry_fair_value,
+                     now or datetime.now())
         logger.info(f"✅ Position opened: {market_id} {side} x{size} @ {entry_price}")
         return True
-    
+
     def update_position(self, market_id: str, current_price: float, current_fair_value: float):
         """Update position with latest data"""
-        if market_id in self.positions:
-            self.positions[market_id].update(current_price, current_fair_value)
-    
+        idx = self._id_to_idx.get(market_id)
+        if idx is not None:
+            self._cur_prices[idx] = current_price
+            self._cur_fv[idx] = current_fair_value
+            self._summary_dirty = True
+
+    def update_all(self, prices, fair_values):
+        """Refresh every open position's price/fair value in one write
+
+        `prices` and `fair_values` must be aligned with the current SoA
+        order (the iteration order of held_ids()); one vectorized store
+        replaces a Python update_position call per position.
+        """
+        n = len(self._ids)
+        self._cur_prices[:n] = prices
+        self._cur_fv[:n] = fair_values
+        self._summary_dirty = True
+
     def should_cut_position(self, market_id: str) -> tuple[bool, Optional[str]]:
         """
         PTJ Rule: Cut losers fast if edge evaporates
         Check if fair value shifted against us by stop_loss_deviation
         """
-        if market_id not in self.positions:
+        idx = self._id_to_idx.get(market_id)
+        if idx is None:
             return False, None
-        
-        position = self.positions[market_id]
-        edge_loss = position.edge_deterioration()
-        
+
+        cur_fv = self._cur_fv[idx]
+        edge_loss = 0.0 if np.isnan(cur_fv) else abs(cur_fv - self._entry_fv[idx])
+
         if edge_loss >= self.stop_loss_deviation:
             return True, f"Edge flip: {edge_loss:.2%} (stop at {self.stop_loss_deviation:.2%})"
-        
+
         # Additional safety: Hard stop if losing >10% on position
-        pnl = position.pnl()
-        loss_pct = pnl / (position.entry_price * position.size)
+        cur_price = self._cur_prices[idx]
+        pnl = 0.0 if np.isnan(cur_price) else (
+            (cur_price - self._entry_prices[idx]) * self._sides[idx] * self._sizes[idx]
+        )
+        loss_pct = pnl / (self._entry_prices[idx] * self._sizes[idx])
         if loss_pct < -0.10:
             return True, f"Hard stop: {loss_pct:.2%} loss"
-        
+
         return False, None
-    
+
+    def find_cuts(self) -> List[tuple]:
+        """Screen the whole book for cuts in one pass - [(market_id, reason)]
+
+        Vectorized counterpart of should_cut_position: edge flip and hard
+        stop masks are computed across all positions at once, then only the
+        hits are materialized for the exit path.
+        """
+        n = len(self._ids)
+        if n == 0:
+            return []
+
+        edge = np.abs(self._cur_fv[:n] - self._entry_fv[:n])
+        edge = np.where(np.isnan(edge), 0.0, edge)
+        basis = self._entry_prices[:n] * self._sizes[:n]
+        loss_pct = np.where(basis > 0, self._pnl_vector() / basis, 0.0)
+
+        edge_cut = edge >= self.stop_loss_deviation
+        hard_cut = loss_pct < -0.10
+
+        cuts = []
+        for idx in np.nonzero(edge_cut | hard_cut)[0]:
+            if edge_cut[idx]:
+                reason = f"Edge flip: {edge[idx]:.2%} (stop at {self.stop_loss_deviation:.2%})"
+            else:
+                reason = f"Hard stop: {loss_pct[idx]:.2%} loss"
+            cuts.append((self._ids[idx], reason))
+        return cuts
+
     def close_position(self, market_id: str, exit_price: float, reason: str = "manual"):
         """Close position and update balance"""
-        if market_id not in self.positions:
+        idx = self._id_to_idx.get(market_id)
+        if idx is None:
             logger.warning(f"Cannot close non-existent position: {market_id}")
             return
-        
-        position = self.positions[market_id]
-        position.update(exit_price, position.current_fair_value or position.entry_fair_value)
-        pnl = position.pnl()
-        
+
+        pnl = (exit_price - self._entry_prices[idx]) * self._sides[idx] * self._sizes[idx]
+
         self.current_balance += pnl
+        self._summary_dirty = True
         logger.info(f"🔒 Position closed: {market_id} | P&L: ${pnl:.2f} | Reason: {reason}")
-        
-        del self.positions[market_id]
+
+        self._remove(market_id)
         self._check_daily_reset()
         self.check_daily_drawdown()
-    
+
     def get_portfolio_summary(self) -> dict:
-        """Get current portfolio state"""
-        total_pnl = sum(pos.pnl() for pos in self.positions.values())
+        """Get current portfolio state
+
+        Cached between mutations - repeat calls (dashboard every 10th loop)
+        return the same dict without redoing the vector math.
+        """
+        if not self._summary_dirty and self._cached_summary is not None:
+            return self._cached_summary
+
+        total_pnl = float(self._pnl_vector().sum())
         daily_pnl = self.current_balance - self.daily_start_balance
-        
-        return {
+
+        self._cached_summary = {
             'balance': self.current_balance,
             'peak_balance': self.peak_balance,
             'total_drawdown_pct': (self.current_balance - self.peak_balance) / self.peak_balance,
             'daily_pnl': daily_pnl,
             'daily_pnl_pct': daily_pnl / self.daily_start_balance,
-            'open_positions': len(self.positions),
+            'open_positions': len(self._ids),
             'unrealized_pnl': total_pnl,
             'halted': self.halted,
             'halt_reason': self.halt_reason,
         }
+        self._summary_dirty = False
+        return self._cached_summary
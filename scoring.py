@@ -0,0 +1,150 @@
+"""
+Hot Scoring Kernels - Batch Market Math
+Scalar per-market arithmetic extracted from the scan loop into a single
+kernel call; compiles to native code when numba is installed
+"""
+import numpy as np
+
+try:
+    # Optional: numba JIT-compiles the kernels to native code (cache=True
+    # persists the compilation across restarts)
+    from numba import njit
+    _HAVE_NUMBA = True
+except ImportError:
+    _HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """Fallback decorator when numba isn't installed - runs plain Python"""
+        def decorate(func):
+            return func
+        if args and callable(args[0]):
+            return args[0]
+        return decorate
+
+
+@njit(cache=True)
+def _arb_pairs_loop(probs, threshold):
+    """O(1)-memory pair screen - only worth running as native code"""
+    n = probs.shape[0]
+    count = 0
+    for i in range(n):
+        for j in range(i + 1, n):
+            d = probs[i] - probs[j]
+            if d > threshold and d > 0.1:
+                count += 1
+
+    idx_i = np.empty(count, dtype=np.int64)
+    idx_j = np.empty(count, dtype=np.int64)
+    k = 0
+    for i in range(n):
+        for j in range(i + 1, n):
+            d = probs[i] - probs[j]
+            if d > threshold and d > 0.1:
+                idx_i[k] = i
+                idx_j[k] = j
+                k += 1
+    return idx_i, idx_j
+
+
+def _arb_pairs_broadcast(probs, threshold):
+    """NumPy fallback - O(n^2) temporary, but no Python-level inner loop"""
+    diff = probs[:, None] - probs[None, :]
+    n = probs.shape[0]
+    candidates = (diff > threshold) & (diff > 0.1)
+    candidates &= np.triu(np.ones((n, n), dtype=bool), k=1)
+    return np.nonzero(candidates)
+
+
+def arb_candidate_pairs(probs, threshold):
+    """
+    Upper-triangle price-discrepancy screen for the arbitrage detector
+    Returns (idx_i, idx_j) index arrays with i < j where the implied
+    probability gap clears both the config threshold and the 0.1 floor;
+    relatedness filtering stays with the caller.
+    """
+    if _HAVE_NUMBA:
+        return _arb_pairs_loop(probs, threshold)
+    return _arb_pairs_broadcast(probs, threshold)
+
+
+@njit(cache=True)
+def _score_markets_loop(bids, asks, fair, balance, risk_pct, stop_dev, threshold):
+    """Per-element scoring loop - only worth running as native code"""
+    n = bids.shape[0]
+    mask = np.zeros(n, dtype=np.bool_)
+    devs = np.zeros(n, dtype=np.float32)
+    sides = np.zeros(n, dtype=np.int8)
+    entries = np.zeros(n, dtype=np.float32)
+    sizes = np.zeros(n, dtype=np.float32)
+
+    for i in range(n):
+        implied = (bids[i] + asks[i]) * 0.005
+        dev = abs(fair[i] - implied)
+        if dev < threshold:
+            continue
+
+        mask[i] = True
+        devs[i] = dev
+
+        # Buy underpriced, sell overpriced
+        if fair[i] > implied:
+            sides[i] = 1
+            entry = asks[i] * 0.01
+        else:
+            sides[i] = 0
+            entry = 1.0 - bids[i] * 0.01
+        entries[i] = entry
+
+        # Risk-based sizing scaled by edge strength
+        if balance <= 0.0 or entry <= 0.0:
+            continue
+        mult = dev / stop_dev
+        if mult > 1.5:
+            mult = 1.5
+        size = round(balance * risk_pct * mult / entry)
+        sizes[i] = size if size > 1.0 else 1.0
+
+    return mask, devs, sides, entries, sizes
+
+
+def _score_markets_numpy(bids, asks, fair, balance, risk_pct, stop_dev, threshold):
+    """NumPy fallback - same math as the loop, in whole-array ops"""
+    implied = (bids + asks) * np.float32(0.005)
+    dev = np.abs(fair - implied)
+    mask = dev >= threshold
+
+    devs = np.where(mask, dev, 0.0).astype(np.float32)
+
+    # Buy underpriced, sell overpriced
+    yes = fair > implied
+    sides = np.where(mask & yes, 1, 0).astype(np.int8)
+    entry = np.where(yes, asks * np.float32(0.01),
+                     1.0 - bids * np.float32(0.01)).astype(np.float32)
+    entries = np.where(mask, entry, 0.0).astype(np.float32)
+
+    # Risk-based sizing scaled by edge strength (np.round matches the
+    # loop's round: both are half-to-even)
+    mult = np.minimum(dev / stop_dev, 1.5)
+    safe_entry = np.where(entry > 0.0, entry, 1.0)
+    size = np.maximum(np.round(balance * risk_pct * mult / safe_entry), 1.0)
+    sizeable = mask & (entry > 0.0) if balance > 0.0 else np.zeros_like(mask)
+    sizes = np.where(sizeable, size, 0.0).astype(np.float32)
+
+    return mask, devs, sides, entries, sizes
+
+
+def score_markets(bids, asks, fair, balance, risk_pct, stop_dev, threshold):
+    """
+    Score a batch of markets in one pass
+    Mirrors the edge/side/entry/sizing logic of scan_and_trade +
+    RiskManager.calculate_position_size
+
+    Args are float32 arrays (bids/asks in cents, fair as probability) plus
+    scalar config. Returns (mask, devs, sides, entries, sizes) where sides
+    is int8 (1 = yes, 0 = no) and entries/sizes are only valid where mask.
+    """
+    if _HAVE_NUMBA:
+        return _score_markets_loop(bids, asks, fair, balance, risk_pct,
+                                   stop_dev, threshold)
+    return _score_markets_numpy(bids, asks, fair, balance, risk_pct,
+                                stop_dev, threshold)
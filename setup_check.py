@@ -20,7 +20,7 @@ def check_python_version():
 
 def check_dependencies():
     """Check if dependencies are installed"""
-    required = ['aiohttp', 'pandas', 'python-dotenv', 'colorlog', 'backoff', 'aiolimiter']
+    required = ['aiohttp', 'pandas', 'numpy', 'python-dotenv', 'colorlog', 'orjson', 'cachetools']
     missing = []
     
     for package in required:
@@ -48,17 +48,21 @@ def check_env_file():
         return False
     
     print("✅ .env file exists")
-    
-    # Check for required keys
+
+    # Parse the file once into a dict; each key check is then an O(1)
+    # lookup instead of several substring scans over the whole content
+    env = {}
+    for line in env_path.read_text().splitlines():
+        if '=' in line and not line.lstrip().startswith('#'):
+            key, _, value = line.partition('=')
+            env[key.strip()] = value.strip()
+
     required_keys = ['KALSHI_API_KEY', 'KALSHI_API_SECRET', 'KALSHI_ENV']
-    with open(env_path) as f:
-        content = f.read()
-    
-    missing_keys = []
-    for key in required_keys:
-        if f"{key}=" not in content or f"{key}=your_" in content or f"{key}=\n" in content:
-            missing_keys.append(key)
-    
+    missing_keys = [
+        key for key in required_keys
+        if not env.get(key) or env[key].startswith('your_')
+    ]
+
     if missing_keys:
         print(f"⚠️ Missing or incomplete keys in .env:")
         for key in missing_keys:
@@ -72,9 +76,9 @@ def check_env_file():
 def validate_config():
     """Import and validate config"""
     try:
-        from config import Config
-        
-        errors = Config.validate()
+        from config import CONFIG, CONFIG_ERRORS
+
+        errors = CONFIG_ERRORS
         if errors:
             print("❌ Configuration errors:")
             for error in errors:
@@ -82,11 +86,11 @@ def validate_config():
             return False
         
         print("✅ Configuration valid")
-        print(f"   Environment: {Config.KALSHI_ENV}")
-        print(f"   Risk per trade: {Config.RISK_PER_TRADE_PCT:.1%}")
-        print(f"   Max daily DD: {Config.MAX_DAILY_DRAWDOWN_PCT:.1%}")
+        print(f"   Environment: {CONFIG.KALSHI_ENV}")
+        print(f"   Risk per trade: {CONFIG.RISK_PER_TRADE_PCT:.1%}")
+        print(f"   Max daily DD: {CONFIG.MAX_DAILY_DRAWDOWN_PCT:.1%}")
         
-        if Config.KALSHI_ENV != 'demo':
+        if CONFIG.KALSHI_ENV != 'demo':
             print("\n⚠️ WARNING: You are configured for LIVE trading!")
             print("   Recommendation: Start with KALSHI_ENV=demo")
         
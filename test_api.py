@@ -3,9 +3,23 @@ Simple test script to verify Kalshi API connection
 Tests authentication and basic API calls without placing orders
 """
 import asyncio
+import functools
+import time
 import aiohttp
+
+try:
+    # Optional: libuv event loop - faster socket dispatch for every await
+    # below (not available on Windows, which this repo still supports)
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+import numpy as np
+import orjson
 from dotenv import load_dotenv
 import os
+import sys
+from typing import Optional
 from kalshi_auth import KalshiAuth
 
 load_dotenv()
@@ -18,16 +32,157 @@ KALSHI_BASE_URL = (
     else 'https://api.elections.kalshi.com'
 )
 
+# Endpoint paths are fixed inputs - hoist them so each call passes the
+# same interned string into the signer and the session
+BALANCE_PATH = '/trade-api/v2/portfolio/balance'
+MARKETS_PATH = '/trade-api/v2/markets'
+
+# One shared session for all probes - the session owns the TCP pool and
+# keep-alives, so reusing it means a single TLS handshake for the run
+_SESSION: Optional[aiohttp.ClientSession] = None
+
+
+async def get_session() -> aiohttp.ClientSession:
+    """Lazily create the shared ClientSession"""
+    global _SESSION
+    if _SESSION is None or _SESSION.closed:
+        # aiohttp already sets TCP_NODELAY on its sockets, so small JSON
+        # replies aren't held back by Nagle; cleanup_closed reaps sockets
+        # stuck in closing state so the pool never hands one back
+        connector = aiohttp.TCPConnector(
+            limit=100,
+            ttl_dns_cache=300,
+            keepalive_timeout=75,
+            enable_cleanup_closed=True,
+        )
+        _SESSION = aiohttp.ClientSession(base_url=KALSHI_BASE_URL, connector=connector)
+    return _SESSION
+
+
+@functools.lru_cache(maxsize=64)
+def _signed_headers(auth: KalshiAuth, method: str, path: str, ts_bucket: int) -> dict:
+    """Auth headers memoized per (method, path, millisecond bucket)
+
+    The signature only varies with the millisecond timestamp, so repeat
+    requests to the same path within a bucket skip the RSA-PSS sign and
+    cost a dict lookup instead.
+    """
+    return auth.get_auth_headers(method, path)
+
+
+async def _fetch_balance(session: aiohttp.ClientSession, auth: KalshiAuth) -> bool:
+    """Test 1: balance probe - False only on auth failure or error
+
+    Output is buffered into one stdout write, which also keeps this
+    probe's lines contiguous when both probes run concurrently.
+    """
+    out = ["Test 1: Fetching account balance..."]
+    try:
+        balance_headers = _signed_headers(auth, 'GET', BALANCE_PATH,
+                                          time.time_ns() // 1_000_000)
+        async with session.get(BALANCE_PATH, headers=balance_headers) as resp:
+            if resp.status == 200:
+                # Known endpoint, known encoding: reading raw bytes skips
+                # resp.json()'s charset detection and content-type parse;
+                # orjson assumes UTF-8, which Kalshi guarantees. Sanity-check
+                # the header once here rather than on every bot request.
+                ctype = resp.headers.get('Content-Type', '')
+                if 'application/json' not in ctype:
+                    out.append(f"⚠️ Unexpected content type: {ctype}")
+                data = orjson.loads(await resp.read())
+                # Format the cents integer directly - no float division and
+                # no float->str rounding on the way back out
+                b = int(data.get('balance', 0))
+                out.append(f"✅ Balance: ${b // 100:,}.{b % 100:02d}")
+            elif resp.status == 401:
+                out.append("❌ Authentication failed - check API key")
+                out.append(f"   Response: {await resp.text()}")
+                return False
+            else:
+                out.append(f"⚠️ Unexpected status: {resp.status}")
+                out.append(f"   Response: {await resp.text()}")
+    except Exception as e:
+        out.append(f"❌ Error: {e}")
+        return False
+    finally:
+        sys.stdout.write('\n'.join(out) + '\n')
+    return True
+
+
+async def _fetch_markets(session: aiohttp.ClientSession, auth: KalshiAuth) -> bool:
+    """Test 2: markets probe - output buffered like the balance probe"""
+    out = ["Test 2: Fetching open markets..."]
+    try:
+        markets_headers = _signed_headers(auth, 'GET', MARKETS_PATH,
+                                          time.time_ns() // 1_000_000)
+        async with session.get(MARKETS_PATH, params={'status': 'open', 'limit': 5}, headers=markets_headers) as resp:
+            if resp.status == 200:
+                # Stream the body in chunks into one bytearray - markets
+                # pages grow to several MB once the limit is raised, and
+                # this skips read()'s extra immutable bytes join
+                buf = bytearray()
+                async for chunk in resp.content.iter_chunked(65536):
+                    buf.extend(chunk)
+                data = orjson.loads(memoryview(buf))
+                markets = data.get('markets', [])
+                out.append(f"✅ Found {len(markets)} markets")
+
+                if markets:
+                    # Batch the sample formatting: slice titles once, pull
+                    # prices in one vector op, and emit a single print
+                    # instead of two per market
+                    sample = markets[:3]
+                    titles = [m.get('title', 'Unknown')[:60] for m in sample]
+                    # Prices stay as cent integers end to end; a whole-cent
+                    # price is a whole percent, so the old /100 + :.2% float
+                    # round-trip is just {cents}.00%
+                    bids = np.fromiter((m.get('yes_bid', 0) for m in sample),
+                                       dtype=np.int32, count=len(sample))
+                    asks = np.fromiter((m.get('yes_ask', 0) for m in sample),
+                                       dtype=np.int32, count=len(sample))
+                    out.append("\nSample markets:")
+                    out.extend(
+                        f"  {i}. {t}\n     Bid: {b:d}.00% | Ask: {a:d}.00%"
+                        for i, (t, b, a) in enumerate(zip(titles, bids, asks), 1)
+                    )
+            else:
+                out.append(f"⚠️ Status: {resp.status}")
+    except Exception as e:
+        out.append(f"❌ Error: {e}")
+        return False
+    finally:
+        sys.stdout.write('\n'.join(out) + '\n')
+    return True
+
+
+async def _warm_up(session: aiohttp.ClientSession):
+    """Complete the TCP+TLS handshake before the first signed request
+
+    Best effort - any error here will resurface on the real probes.
+    """
+    try:
+        async with session.head(MARKETS_PATH):
+            pass
+    except Exception:
+        pass
+
 
 async def test_connection():
     """Test API connection and authentication"""
-    print("=" * 60)
-    print("🔌 Testing Kalshi API Connection")
-    print(f"Environment: {KALSHI_ENV.upper()}")
-    print(f"URL: {KALSHI_BASE_URL}")
-    print("=" * 60)
-    print()
-    
+    sys.stdout.write('\n'.join((
+        "=" * 60,
+        "🔌 Testing Kalshi API Connection",
+        f"Environment: {KALSHI_ENV.upper()}",
+        f"URL: {KALSHI_BASE_URL}",
+        "=" * 60,
+        "",
+    )) + '\n')
+
+    # Start the handshake in the background so it overlaps the private-key
+    # load and RSA signing below instead of running after them
+    session = await get_session()
+    warmup = asyncio.create_task(_warm_up(session))
+
     try:
         # Initialize authentication
         auth = KalshiAuth(KALSHI_API_KEY, KALSHI_PRIVATE_KEY_PATH)
@@ -35,67 +190,38 @@ async def test_connection():
         print(f"❌ Private key file not found: {KALSHI_PRIVATE_KEY_PATH}")
         print("   Download your private key from https://kalshi.com/settings/api")
         print(f"   Save it as: {KALSHI_PRIVATE_KEY_PATH}")
+        warmup.cancel()
+        await session.close()
         return False
     except Exception as e:
         print(f"❌ Authentication setup failed: {e}")
+        warmup.cancel()
+        await session.close()
         return False
-    
-    async with aiohttp.ClientSession(base_url=KALSHI_BASE_URL) as session:
-        # Test 1: Fetch balance
-        print("Test 1: Fetching account balance...")
-        try:
-            balance_path = '/trade-api/v2/portfolio/balance'
-            balance_headers = auth.get_auth_headers('GET', balance_path)
-            async with session.get(balance_path, headers=balance_headers) as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    balance = data.get('balance', 0) / 100  # Convert cents to dollars
-                    print(f"✅ Balance: ${balance:,.2f}")
-                elif resp.status == 401:
-                    print("❌ Authentication failed - check API key")
-                    print(f"   Response: {await resp.text()}")
-                    return False
-                else:
-                    print(f"⚠️ Unexpected status: {resp.status}")
-                    print(f"   Response: {await resp.text()}")
-                    print(await resp.text())
-        except Exception as e:
-            print(f"❌ Error: {e}")
-            return False
-        
-        print()
-        
-        # Test 2: Fetch markets
-        print("Test 2: Fetching open markets...")
-        try:
-            markets_path = '/trade-api/v2/markets'
-            markets_headers = auth.get_auth_headers('GET', markets_path)
-            async with session.get(markets_path, params={'status': 'open', 'limit': 5}, headers=markets_headers) as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    markets = data.get('markets', [])
-                    print(f"✅ Found {len(markets)} markets")
-                    
-                    if markets:
-                        print("\nSample markets:")
-                        for i, market in enumerate(markets[:3], 1):
-                            title = market.get('title', 'Unknown')
-                            yes_bid = market.get('yes_bid', 0) / 100
-                            yes_ask = market.get('yes_ask', 0) / 100
-                            print(f"  {i}. {title[:60]}")
-                            print(f"     Bid: {yes_bid:.2%} | Ask: {yes_ask:.2%}")
-                else:
-                    print(f"⚠️ Status: {resp.status}")
-        except Exception as e:
-            print(f"❌ Error: {e}")
+
+    try:
+        # Asynchronous batching: schedule the balance probe as a task first
+        # so its GET is already on the wire while the markets probe is still
+        # signing headers; wall-clock stays max(RTT) instead of the sum
+        balance_task = asyncio.create_task(_fetch_balance(session, auth))
+        markets_task = asyncio.create_task(_fetch_markets(session, auth))
+        balance_ok = await balance_task
+        markets_ok = await markets_task
+        if not (balance_ok and markets_ok):
             return False
-        
-        print()
-        print("=" * 60)
-        print("✅ API connection successful!")
-        print("You're ready to run the bot.")
-        print("=" * 60)
+
+        sys.stdout.write('\n'.join((
+            "",
+            "=" * 60,
+            "✅ API connection successful!",
+            "You're ready to run the bot.",
+            "=" * 60,
+        )) + '\n')
         return True
+    finally:
+        if not warmup.done():
+            warmup.cancel()
+        await session.close()
 
 
 if __name__ == '__main__':
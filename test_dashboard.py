@@ -2,12 +2,12 @@
 """Quick test of the dashboard feature"""
 
 import sys
-import asyncio
+import types
 from datetime import datetime
 from kalshi_bot import KalshiBot
 from risk_manager import Position
 
-async def test():
+def test():
     # Create bot
     bot = KalshiBot()
     
@@ -20,7 +20,6 @@ async def test():
         entry_fair_value=0.55,
         timestamp=datetime.now()
     )
-    pos1.update(current_price=0.48, current_fair_value=0.52)
     
     pos2 = Position(
         market_id='TEST2',
@@ -30,12 +29,14 @@ async def test():
         entry_fair_value=0.55,
         timestamp=datetime.now()
     )
-    pos2.update(current_price=0.58, current_fair_value=0.54)
     
-    bot.risk_manager.positions = {
-        'TEST1': pos1,
-        'TEST2': pos2
-    }
+    # Single bulk build, frozen read-only - the dashboard only iterates it
+    positions = dict(zip(('TEST1', 'TEST2'), (pos1, pos2)))
+    bot.risk_manager.positions = types.MappingProxyType(positions)
+
+    # Refresh both positions with one vectorized write instead of a
+    # scalar Position.update per market
+    bot.risk_manager.update_all([0.48, 0.58], [0.52, 0.54])
     
     # Print the dashboard
     print("Testing print_portfolio_dashboard()...")
@@ -43,4 +44,4 @@ async def test():
     print("\n✅ Dashboard test completed successfully!")
 
 if __name__ == '__main__':
-    asyncio.run(test())
+    test()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""Offline test of the conditional-GET path in _api_request
+
+Feeds the bot a stubbed 200-with-ETag response followed by a 304 and
+asserts the cached payload comes back without a reparse - no network or
+credentials needed, so the 304 fast path can't regress silently.
+"""
+import asyncio
+import orjson
+from kalshi_bot import KalshiBot
+
+PAYLOAD = {'markets': [{'ticker': 'M1'}], 'cursor': None}
+
+
+class _StubAuth:
+    def get_auth_headers(self, method, path):
+        return {}
+
+
+class _StubResponse:
+    def __init__(self, status, headers, body):
+        self.status = status
+        self.headers = headers
+        self._body = body
+        self.content = self
+
+    async def iter_chunked(self, size):
+        yield self._body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class _StubSession:
+    """First request gets a 200 with an ETag; revalidations get a 304"""
+
+    def __init__(self):
+        self.requests = []
+
+    def request(self, method, endpoint, headers=None, **kwargs):
+        self.requests.append(dict(headers or {}))
+        if 'If-None-Match' in (headers or {}):
+            return _StubResponse(304, {}, b'')
+        return _StubResponse(200, {'ETag': '"abc123"'}, orjson.dumps(PAYLOAD))
+
+
+async def test():
+    bot = KalshiBot()
+    bot._auth = _StubAuth()
+    bot.session = _StubSession()
+
+    first = await bot._api_request('GET', '/trade-api/v2/markets',
+                                   etag_key='markets:test')
+    assert first == PAYLOAD, f"unexpected first payload: {first}"
+
+    second = await bot._api_request('GET', '/trade-api/v2/markets',
+                                    etag_key='markets:test')
+    assert second is first, "304 should return the cached payload object"
+    assert bot.session.requests[1].get('If-None-Match') == '"abc123"', \
+        "revalidation should send the stored ETag"
+
+    print("✅ ETag revalidation test passed!")
+
+
+if __name__ == '__main__':
+    asyncio.run(test())